@@ -122,10 +122,14 @@ texinfo_documents = [
 intersphinx_mapping = {
     "cssselect": ("https://cssselect.readthedocs.io/en/latest", None),
     "python": ("https://docs.python.org/3", None),
-    "requests": ("https://requests.kennethreitz.org/en/latest", None),
+    "requests": ("https://requests.readthedocs.io/en/latest", None),
     "lxml": ("https://lxml.de/apidoc/", None),
 }
 
+# Inventories are fetched concurrently; do not let a single unresponsive host
+# stall the whole build.
+intersphinx_timeout = 10
+
 
 # --- Nitpicking options ------------------------------------------------------
 
@@ -1,5 +1,6 @@
 import os
 from doctest import ELLIPSIS, NORMALIZE_WHITESPACE
+from functools import lru_cache
 
 from sybil import Sybil
 
@@ -15,10 +16,17 @@ from sybil.parsers.skip import skip
 from parsel import Selector
 
 
-def load_selector(filename, **kwargs):
+@lru_cache(maxsize=None)
+def _read_fixture(filename):
     input_path = os.path.join(os.path.dirname(__file__), "_static", filename)
-    with open(input_path, encoding="utf-8") as input_file:
-        return Selector(text=input_file.read(), **kwargs)
+    with open(input_path, "rb") as input_file:
+        return input_file.read()
+
+
+def load_selector(filename, **kwargs):
+    # Each fixture is read from disk once; examples get a freshly parsed
+    # document, as some of them modify it (e.g. remove_namespaces()).
+    return Selector(body=_read_fixture(filename), encoding="utf-8", **kwargs)
 
 
 def setup(namespace):
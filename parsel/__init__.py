@@ -13,8 +13,36 @@ __all__ = [
     "xpathfuncs",
 ]
 
-from parsel import xpathfuncs  # NOQA
-from parsel.csstranslator import css2xpath  # NOQA
-from parsel.selector import Selector, SelectorList  # NOQA
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-xpathfuncs.setup()
+if TYPE_CHECKING:
+    from parsel import xpathfuncs  # NOQA
+    from parsel.csstranslator import css2xpath  # NOQA
+    from parsel.selector import Selector, SelectorList  # NOQA
+
+# Public names are imported on first access (PEP 562), so that importing
+# parsel does not load lxml and cssselect until they are actually needed.
+_lazy_attributes = {
+    "Selector": "parsel.selector",
+    "SelectorList": "parsel.selector",
+    "css2xpath": "parsel.csstranslator",
+}
+_submodules = {"csstranslator", "selector", "utils", "xpathfuncs"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        return import_module(f"{__name__}.{name}")
+    try:
+        module_name = _lazy_attributes[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | _submodules)
@@ -1,5 +1,4 @@
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Tuple, cast
 
 from cssselect import GenericTranslator as OriginalGenericTranslator
 from cssselect import HTMLTranslator as OriginalHTMLTranslator
@@ -31,6 +30,9 @@ class XPathExpr(OriginalXPathExpr):
 
     def __str__(self) -> str:
         path = super().__str__()
+        if not self.textnode and self.attribute is None:
+            return path
+
         if self.textnode:
             if path == "*":
                 path = "text()"
@@ -58,12 +60,20 @@ class XPathExpr(OriginalXPathExpr):
                 f"Expressions of type {__name__}.XPathExpr can ony join expressions"
                 f" of the same type (or its descendants), got {type(other)}"
             )
-        super().join(combiner, other, *args, **kwargs)
+        # cssselect 1.2 accepts extra join() arguments that later versions
+        # dropped; only forward them when given, which is the rare case.
+        if args or kwargs:
+            super().join(combiner, other, *args, **kwargs)
+        else:
+            super().join(combiner, other)
         self.textnode = other.textnode
         self.attribute = other.attribute
         return self
 
 
+CSS_TO_XPATH_CACHE_SIZE = 4096
+
+
 # e.g. cssselect.GenericTranslator, cssselect.HTMLTranslator
 class TranslatorProtocol(Protocol):
     def xpath_element(self, selector: Element) -> OriginalXPathExpr:
@@ -77,8 +87,55 @@ class TranslatorMixin:
     """This mixin adds support to CSS pseudo elements via dynamic dispatch.
 
     Currently supported pseudo-elements are ``::text`` and ``::attr(ATTR_NAME)``.
+
+    It also caches the results of :meth:`css_to_xpath`, which are pure.
     """
 
+    # Handler method names of each subclass, keyed by pseudo-element name
+    # (with "-" replaced by "_"), collected once when the class is created.
+    # Handlers are still looked up on the instance, so that ones added or
+    # replaced later are used too.
+    _simple_pseudo_elements: Dict[str, str] = {}
+    _functional_pseudo_elements: Dict[str, str] = {}
+
+    # css_to_xpath() results of each translator, see css_to_xpath()
+    _css_to_xpath_cache: Dict[Tuple[str, str], str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._simple_pseudo_elements = {}
+        cls._functional_pseudo_elements = {}
+        for method_name in dir(cls):
+            if not method_name.startswith("xpath_"):
+                continue
+            name = method_name.removeprefix("xpath_")
+            if method_name.endswith("_simple_pseudo_element"):
+                name = name.removesuffix("_simple_pseudo_element")
+                cls._simple_pseudo_elements[name] = method_name
+            elif method_name.endswith("_functional_pseudo_element"):
+                name = name.removesuffix("_functional_pseudo_element")
+                cls._functional_pseudo_elements[name] = method_name
+
+    def css_to_xpath(self, css: str, prefix: str = "descendant-or-self::") -> str:
+        key = (css, prefix)
+        # created on first use, so that it works for subclasses whose
+        # __init__() does not chain up
+        cache: Optional[Dict[Tuple[str, str], str]] = getattr(
+            self, "_css_to_xpath_cache", None
+        )
+        if cache is None:
+            cache = self._css_to_xpath_cache = {}
+        else:
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+        xpath: str = super().css_to_xpath(css, prefix)  # type: ignore[misc]
+        # a plain dict is cheaper than an LRU cache; once full, it stops growing
+        if len(cache) < CSS_TO_XPATH_CACHE_SIZE:
+            cache[key] = xpath
+        return xpath
+
     def xpath_element(self: TranslatorProtocol, selector: Element) -> XPathExpr:
         # https://github.com/python/mypy/issues/14757
         xpath = super().xpath_element(selector)  # type: ignore[safe-super]
@@ -90,23 +147,31 @@ class TranslatorMixin:
         """
         Dispatch method that transforms XPath to support pseudo-element
         """
-        if isinstance(pseudo_element, FunctionalPseudoElement):
-            method_name = f"xpath_{pseudo_element.name.replace('-', '_')}_functional_pseudo_element"
-            method = getattr(self, method_name, None)
+        # cssselect only produces FunctionalPseudoElement objects and plain
+        # strings, so an identity check is enough (and cheaper than isinstance)
+        if type(pseudo_element) is FunctionalPseudoElement:
+            name = pseudo_element.name
+            key = name.replace("-", "_") if "-" in name else name
+            method_name = self._functional_pseudo_elements.get(key)
+            method = getattr(
+                self,
+                method_name or f"xpath_{key}_functional_pseudo_element",
+                None,
+            )
             if not method:
                 raise ExpressionError(
-                    f"The functional pseudo-element ::{pseudo_element.name}() is unknown"
+                    f"The functional pseudo-element ::{name}() is unknown"
                 )
             xpath = method(xpath, pseudo_element)
         else:
-            method_name = (
-                f"xpath_{pseudo_element.replace('-', '_')}_simple_pseudo_element"
+            name = cast(str, pseudo_element)
+            key = name.replace("-", "_") if "-" in name else name
+            method_name = self._simple_pseudo_elements.get(key)
+            method = getattr(
+                self, method_name or f"xpath_{key}_simple_pseudo_element", None
             )
-            method = getattr(self, method_name, None)
             if not method:
-                raise ExpressionError(
-                    f"The pseudo-element ::{pseudo_element} is unknown"
-                )
+                raise ExpressionError(f"The pseudo-element ::{name} is unknown")
             xpath = method(xpath)
         return xpath
 
@@ -126,15 +191,11 @@ class TranslatorMixin:
 
 
 class GenericTranslator(TranslatorMixin, OriginalGenericTranslator):
-    @lru_cache(maxsize=256)
-    def css_to_xpath(self, css: str, prefix: str = "descendant-or-self::") -> str:
-        return super().css_to_xpath(css, prefix)
+    pass
 
 
 class HTMLTranslator(TranslatorMixin, OriginalHTMLTranslator):
-    @lru_cache(maxsize=256)
-    def css_to_xpath(self, css: str, prefix: str = "descendant-or-self::") -> str:
-        return super().css_to_xpath(css, prefix)
+    pass
 
 
 _translator = HTMLTranslator()
@@ -2,14 +2,17 @@
 packages."""
 
 import json
+import re
+import threading
 import typing
 import warnings
+from functools import lru_cache, partial
 from io import BytesIO
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
-    Literal,
     Mapping,
     Optional,
     Pattern,
@@ -22,20 +25,15 @@ from typing import (
 )
 from warnings import warn
 
-import jmespath
 from lxml import etree, html
 from packaging.version import Version
 
-from .csstranslator import GenericTranslator, HTMLTranslator
-from .utils import extract_regex, flatten, iflatten, shorten
+from . import xpathfuncs
+from .csstranslator import GenericTranslator, HTMLTranslator, _translator
+from .utils import _compile_regex, extract_regex, extract_regex_first, shorten
 
 _SelectorType = TypeVar("_SelectorType", bound="Selector")
 _ParserType = Union[etree.XMLParser, etree.HTMLParser]
-# simplified _OutputMethodArg from types-lxml
-_TostringMethodType = Literal[
-    "html",
-    "xml",
-]
 
 lxml_version = Version(etree.__version__)
 lxml_huge_tree_version = Version("4.2")
@@ -63,19 +61,25 @@ class SafeXMLParser(etree.XMLParser):
 class CTGroupValue(TypedDict):
     _parser: Union[Type[etree.XMLParser], Type[html.HTMLParser]]
     _csstranslator: Union[GenericTranslator, HTMLTranslator]
-    _tostring_method: _TostringMethodType
+    # etree.tostring() with the arguments of Selector.get() bound
+    _tostring: Callable[[Any], str]
 
 
 _ctgroup: Dict[str, CTGroupValue] = {
     "html": {
         "_parser": html.HTMLParser,
-        "_csstranslator": HTMLTranslator(),
-        "_tostring_method": "html",
+        # shared with css2xpath(), so that both use the same translation cache
+        "_csstranslator": _translator,
+        "_tostring": partial(
+            etree.tostring, method="html", encoding="unicode", with_tail=False
+        ),
     },
     "xml": {
         "_parser": SafeXMLParser,
         "_csstranslator": GenericTranslator(),
-        "_tostring_method": "xml",
+        "_tostring": partial(
+            etree.tostring, method="xml", encoding="unicode", with_tail=False
+        ),
     },
 }
 
@@ -84,6 +88,50 @@ def _xml_or_html(type: Optional[str]) -> str:
     return "xml" if type == "xml" else "html"
 
 
+# lxml parsers are expensive to create but cannot be shared between threads,
+# so each thread keeps its own parser per configuration.
+_parsers = threading.local()
+
+
+def _get_parser(
+    parser_cls: Type[_ParserType], encoding: str, huge_tree: bool
+) -> _ParserType:
+    try:
+        cache = _parsers.cache
+    except AttributeError:
+        cache = _parsers.cache = {}
+    key = (parser_cls, encoding, huge_tree)
+    try:
+        return typing.cast(_ParserType, cache[key])
+    except KeyError:
+        pass
+    if huge_tree:
+        parser = parser_cls(recover=True, encoding=encoding, huge_tree=True)
+    else:
+        parser = parser_cls(recover=True, encoding=encoding)
+    cache[key] = parser
+    return parser
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(
+    query: str, namespaces: Tuple[Tuple[str, str], ...], smart_strings: bool
+) -> etree.XPath:
+    """Return a compiled XPath expression, so that repeated queries are only
+    parsed by lxml once."""
+    return etree.XPath(query, namespaces=dict(namespaces), smart_strings=smart_strings)
+
+
+@lru_cache(maxsize=256)
+def _compile_jmespath(query: str) -> Any:
+    """Return a compiled JMESPath expression, so that repeated queries are
+    only parsed by jmespath once."""
+    # jmespath is only needed for JSON input, so import it on first use
+    import jmespath
+
+    return jmespath.compile(query)
+
+
 def create_root_node(
     text: str,
     parser_cls: Type[_ParserType],
@@ -94,15 +142,20 @@ def create_root_node(
 ) -> etree._Element:
     """Create root node for text using given parser class."""
     if not text:
-        body = body.replace(b"\x00", b"").strip()
+        body = body.replace(b"\x00", b"").strip() or b"<html/>"
     else:
-        body = text.strip().replace("\x00", "").encode(encoding) or b"<html/>"
+        text = text.strip()
+        # str.replace() scans the whole string even when there is nothing to
+        # replace, which is much slower than a containment check.
+        if "\x00" in text:
+            text = text.replace("\x00", "")
+        body = text.encode(encoding) or b"<html/>"
 
     if huge_tree and LXML_SUPPORTS_HUGE_TREE:
-        parser = parser_cls(recover=True, encoding=encoding, huge_tree=True)
+        parser = _get_parser(parser_cls, encoding, huge_tree=True)
         root = etree.fromstring(body, parser=parser, base_url=base_url)
     else:
-        parser = parser_cls(recover=True, encoding=encoding)
+        parser = _get_parser(parser_cls, encoding, huge_tree=False)
         root = etree.fromstring(body, parser=parser, base_url=base_url)
         for error in parser.error_log:
             if "use XML_PARSE_HUGE option" in error.message:
@@ -132,11 +185,10 @@ class SelectorList(List[_SelectorType]):
     def __getitem__(
         self, pos: Union["SupportsIndex", slice]
     ) -> Union[_SelectorType, "SelectorList[_SelectorType]"]:
-        o = super().__getitem__(pos)
+        # list.__getitem__ is called directly, which is cheaper than super()
         if isinstance(pos, slice):
-            return self.__class__(typing.cast("SelectorList[_SelectorType]", o))
-        else:
-            return typing.cast(_SelectorType, o)
+            return self.__class__(list.__getitem__(self, pos))
+        return list.__getitem__(self, pos)
 
     def __getstate__(self) -> None:
         raise TypeError("can't pickle SelectorList objects")
@@ -153,7 +205,10 @@ class SelectorList(List[_SelectorType]):
 
             selector.jmespath('author.name', options=jmespath.Options(dict_cls=collections.OrderedDict))
         """
-        return self.__class__(flatten([x.jmespath(query, **kwargs) for x in self]))
+        result: List[_SelectorType] = []
+        for x in self:
+            result.extend(x.jmespath(query, **kwargs))
+        return self.__class__(result)
 
     def xpath(
         self,
@@ -177,9 +232,10 @@ class SelectorList(List[_SelectorType]):
 
             selector.xpath('//a[href=$url]', url="http://www.example.com")
         """
-        return self.__class__(
-            flatten([x.xpath(xpath, namespaces=namespaces, **kwargs) for x in self])
-        )
+        result: List[_SelectorType] = []
+        for x in self:
+            result.extend(x.xpath(xpath, namespaces=namespaces, **kwargs))
+        return self.__class__(result)
 
     def css(self, query: str) -> "SelectorList[_SelectorType]":
         """
@@ -188,7 +244,10 @@ class SelectorList(List[_SelectorType]):
 
         ``query`` is the same argument as the one in :meth:`Selector.css`
         """
-        return self.__class__(flatten([x.css(query) for x in self]))
+        result: List[_SelectorType] = []
+        for x in self:
+            result.extend(x.css(query))
+        return self.__class__(result)
 
     def re(
         self, regex: Union[str, Pattern[str]], replace_entities: bool = True
@@ -202,7 +261,12 @@ class SelectorList(List[_SelectorType]):
         Passing ``replace_entities`` as ``False`` switches off these
         replacements.
         """
-        return flatten([x.re(regex, replace_entities=replace_entities) for x in self])
+        if isinstance(regex, str):
+            regex = _compile_regex(regex)
+        result: List[str] = []
+        for x in self:
+            result.extend(x.re(regex, replace_entities=replace_entities))
+        return result
 
     @typing.overload
     def re_first(
@@ -239,10 +303,12 @@ class SelectorList(List[_SelectorType]):
         Passing ``replace_entities`` as ``False`` switches off these
         replacements.
         """
-        for el in iflatten(
-            x.re(regex, replace_entities=replace_entities) for x in self
-        ):
-            return typing.cast(str, el)
+        if isinstance(regex, str):
+            regex = _compile_regex(regex)
+        for x in self:
+            el = x.re_first(regex, replace_entities=replace_entities)
+            if el is not None:
+                return el
         return default
 
     def getall(self) -> List[str]:
@@ -371,7 +437,16 @@ def _get_root_type(root: Any, *, input_type: Optional[str]) -> str:
     return input_type or "json"
 
 
+# How every document accepted by json.loads() starts, after optional
+# whitespace (NaN and Infinity are extensions of json.loads()).
+_json_start_re = re.compile(r"[ \t\n\r]*(?:[\[{\"\-0-9]|true|false|null|NaN|Infinity)")
+
+
 def _is_valid_json(text: str) -> bool:
+    # Most strings that get here are text nodes, which are rejected by their
+    # first character more cheaply than by a failing json.loads().
+    if isinstance(text, str) and not _json_start_re.match(text):
+        return False
     try:
         json.loads(text)
     except (TypeError, ValueError):
@@ -417,12 +492,14 @@ class Selector:
     """
 
     __slots__ = [
-        "namespaces",
+        "_namespaces",
+        "_namespaces_shared",
         "type",
         "_expr",
         "_huge_tree",
         "root",
         "_text",
+        "_tostring",
         "body",
         "__weakref__",
     ]
@@ -469,10 +546,6 @@ class Selector:
                     "Selector got both text and root, root is being ignored.",
                     stacklevel=2,
                 )
-            if not isinstance(text, str):
-                msg = f"text argument should be of type str, got {text.__class__}"
-                raise TypeError(msg)
-
             root, type = _get_root_and_type_from_text(
                 text,
                 input_type=type,
@@ -494,19 +567,75 @@ class Selector:
             )
             self.root = root
             self.type = type
-        elif root is _NOT_SET:
-            raise ValueError("Selector needs text, body, or root arguments")
         else:
             self.root = root
             self.type = _get_root_type(root, input_type=type)
 
-        self.namespaces = dict(self._default_namespaces)
-        if namespaces is not None:
-            self.namespaces.update(namespaces)
+        if namespaces:
+            self._namespaces = {**self._default_namespaces, **namespaces}
+            self._namespaces_shared = False
+        else:
+            # copied on first access, see namespaces
+            self._namespaces = self._default_namespaces
+            self._namespaces_shared = True
 
         self._expr = _expr
         self._huge_tree = huge_tree
         self._text = text
+        self._tostring: Optional[Callable[[Any], str]] = (
+            _ctgroup[self.type]["_tostring"] if self.type in _ctgroup else None
+        )
+
+    @classmethod
+    def _from_root(
+        cls: Type[_SelectorType],
+        root: Any,
+        _expr: Optional[str],
+        namespaces: Dict[str, str],
+        type: str,
+    ) -> _SelectorType:
+        """Build a selector for an already parsed ``root`` of a known ``type``.
+
+        This skips the argument checks of :meth:`__init__`, which only pay off
+        for user input, and is used for the many child selectors built by
+        :meth:`xpath` and :meth:`jmespath`.
+
+        ``namespaces`` is copied, unless it is the class-wide default mapping,
+        which is shared until it is accessed (see :attr:`namespaces`).
+        """
+        if cls.__init__ is not Selector.__init__:
+            # subclasses may set up their own state in __init__
+            return cls(root=root, _expr=_expr, namespaces=namespaces, type=type)
+        selector = cls.__new__(cls)
+        selector.root = root
+        selector.type = type
+        if namespaces is cls._default_namespaces:
+            selector._namespaces = namespaces
+            selector._namespaces_shared = True
+        else:
+            selector._namespaces = dict(namespaces)
+            selector._namespaces_shared = False
+        selector._expr = _expr
+        selector._huge_tree = LXML_SUPPORTS_HUGE_TREE
+        selector._text = None
+        selector._tostring = _ctgroup[type]["_tostring"] if type in _ctgroup else None
+        return selector
+
+    @property
+    def namespaces(self) -> Dict[str, str]:
+        """Namespace prefixes available to :meth:`xpath`, as a mutable
+        ``prefix: namespace-uri`` dict."""
+        # Selectors without namespaces of their own share the class defaults
+        # until they may modify them, so that building them copies nothing.
+        if self._namespaces_shared:
+            self._namespaces = dict(self._namespaces)
+            self._namespaces_shared = False
+        return self._namespaces
+
+    @namespaces.setter
+    def namespaces(self, namespaces: Dict[str, str]) -> None:
+        self._namespaces = namespaces
+        self._namespaces_shared = False
 
     def __getstate__(self) -> Any:
         raise TypeError("can't pickle Selector objects")
@@ -557,7 +686,7 @@ class Selector:
             assert self.type in {"html", "xml"}  # nosec
             data = _load_json_or_none(self.root.text)
 
-        result = jmespath.search(query, data, **kwargs)
+        result = _compile_jmespath(query).search(data, **kwargs)
         if result is None:
             result = []
         elif not isinstance(result, list):
@@ -566,8 +695,7 @@ class Selector:
         def make_selector(x: Any) -> _SelectorType:  # closure function
             if isinstance(x, str):
                 return self.__class__(text=x, _expr=query, type="text")
-            else:
-                return self.__class__(root=x, _expr=query)
+            return self._from_root(x, query, self._default_namespaces, "json")
 
         result = [make_selector(x) for x in result]
         return typing.cast(SelectorList[_SelectorType], self.selectorlist_cls(result))
@@ -598,46 +726,58 @@ class Selector:
         if self.type not in ("html", "xml", "text"):
             raise ValueError(f"Cannot use xpath on a Selector of type {self.type!r}")
         if self.type in ("html", "xml"):
-            try:
-                xpathev = self.root.xpath
-            except AttributeError:
-                return typing.cast(
-                    SelectorList[_SelectorType], self.selectorlist_cls([])
-                )
+            root = self.root
         else:
-            try:
-                xpathev = self._get_root(self._text or "", type="html").xpath
-            except AttributeError:
-                return typing.cast(
-                    SelectorList[_SelectorType], self.selectorlist_cls([])
-                )
-
-        nsp = dict(self.namespaces)
-        if namespaces is not None:
-            nsp.update(namespaces)
+            root = self._get_root(self._text or "", type="html")
+        # elements, the common case, are known to support XPath; anything
+        # else (e.g. text results) is probed once
+        is_element = isinstance(root, etree._Element)
+        if not is_element and not hasattr(root, "xpath"):
+            return typing.cast(SelectorList[_SelectorType], self.selectorlist_cls([]))
+
+        # only build a merged mapping when the call adds namespaces of its own
+        if namespaces:
+            nsp = {**self._namespaces, **namespaces}
+        else:
+            nsp = self._namespaces
         try:
-            result = xpathev(
-                query,
-                namespaces=nsp,
-                smart_strings=self._lxml_smart_strings,
-                **kwargs,
-            )
+            # keyword arguments are XPath variables, except for the lxml
+            # options of root.xpath(), which compiled expressions do not take
+            if is_element and "extensions" not in kwargs:
+                result = _compile_xpath(
+                    query, tuple(nsp.items()), self._lxml_smart_strings
+                )(root, **kwargs)
+            else:
+                result = root.xpath(
+                    query,
+                    namespaces=nsp,
+                    smart_strings=self._lxml_smart_strings,
+                    **kwargs,
+                )
         except etree.XPathError as exc:
             raise ValueError(f"XPath error: {exc} in {query}")
 
-        if type(result) is not list:
-            result = [result]
-
-        result = [
-            self.__class__(
-                root=x,
-                _expr=query,
-                namespaces=self.namespaces,
-                type=_xml_or_html(self.type),
+        # string, number and boolean results are single values
+        items = result if type(result) is list else (result,)
+
+        # Elements are the common case and need no type detection, so they
+        # take the fast path; other values may turn out to be JSON.
+        cls = self.__class__
+        from_root = cls._from_root
+        element_cls = etree._Element
+        ns = self._namespaces
+        type_ = _xml_or_html(self.type)
+        selectors = [
+            (
+                from_root(x, query, ns, type_)
+                if isinstance(x, element_cls)
+                else cls(root=x, _expr=query, namespaces=ns, type=type_)
             )
-            for x in result
+            for x in items
         ]
-        return typing.cast(SelectorList[_SelectorType], self.selectorlist_cls(result))
+        return typing.cast(
+            SelectorList[_SelectorType], self.selectorlist_cls(selectors)
+        )
 
     def css(self: _SelectorType, query: str) -> SelectorList[_SelectorType]:
         """
@@ -710,10 +850,8 @@ class Selector:
         Passing ``replace_entities`` as ``False`` switches off these
         replacements.
         """
-        return next(
-            iflatten(self.re(regex, replace_entities=replace_entities)),
-            default,
-        )
+        el = extract_regex_first(regex, self.get(), replace_entities=replace_entities)
+        return default if el is None else el
 
     def get(self) -> Any:
         """
@@ -722,22 +860,28 @@ class Selector:
         For HTML and XML, the result is always a string, and percent-encoded
         content is unquoted.
         """
-        if self.type in ("text", "json"):
+        tostring = self._tostring
+        if tostring is None:
+            # "text" and "json" selectors hold their data as-is
             return self.root
+        root = self.root
+        if isinstance(root, etree._Element):
+            return tostring(root)
+        # XPath text, attribute, boolean and number results cannot be
+        # serialized; spare the failing etree.tostring() call
+        if isinstance(root, str):
+            return str(root)
+        if root is True:
+            return "1"
+        if root is False:
+            return "0"
+        if isinstance(root, float):
+            return str(root)
         try:
-            return etree.tostring(
-                self.root,
-                method=_ctgroup[self.type]["_tostring_method"],
-                encoding="unicode",
-                with_tail=False,
-            )
+            # e.g. an element tree passed as root
+            return tostring(root)
         except (AttributeError, TypeError):
-            if self.root is True:
-                return "1"
-            elif self.root is False:
-                return "0"
-            else:
-                return str(self.root)
+            return str(root)
 
     extract = get
 
@@ -760,13 +904,26 @@ class Selector:
         Remove all namespaces, allowing to traverse the document using
         namespace-less xpaths. See :ref:`removing-namespaces`.
         """
+        # the same qualified names repeat throughout a document, so each one
+        # is only split once
+        local_names: Dict[str, str] = {}
         for el in self.root.iter("*"):
-            if el.tag.startswith("{"):
-                el.tag = el.tag.split("}", 1)[1]
-            # loop on element attributes also
-            for an in el.attrib:
-                if an.startswith("{"):
-                    el.attrib[an.split("}", 1)[1]] = el.attrib.pop(an)
+            tag = el.tag
+            if tag[0] == "{":
+                local_name = local_names.get(tag)
+                if local_name is None:
+                    local_name = local_names[tag] = tag[tag.index("}") + 1 :]
+                el.tag = local_name
+            # loop on element attributes also; keys() returns a list, so the
+            # attributes can be renamed while iterating
+            attrib = el.attrib
+            if attrib:
+                for an in attrib.keys():
+                    if an[0] == "{":
+                        local_name = local_names.get(an)
+                        if local_name is None:
+                            local_name = local_names[an] = an[an.index("}") + 1 :]
+                        attrib[local_name] = attrib.pop(an)
         # remove namespace declarations
         etree.cleanup_namespaces(self.root)
 
@@ -839,6 +996,9 @@ class Selector:
         otherwise.  In other words, the boolean value of a :class:`Selector` is
         given by the contents it selects.
         """
+        if isinstance(self.root, etree._Element):
+            # elements never serialize to an empty string
+            return True
         return bool(self.get())
 
     __nonzero__ = __bool__
@@ -849,3 +1009,11 @@ class Selector:
     def __repr__(self) -> str:
         data = repr(shorten(str(self.get()), width=40))
         return f"<{type(self).__name__} query={self._expr!r} data={data}>"
+
+
+# Compiled XPath expressions keep the extension functions they resolved, so
+# they are discarded whenever set_xpathfunc() changes one.
+xpathfuncs._on_xpathfunc_change.append(_compile_xpath.cache_clear)
+# Register parsel's XPath extension functions (e.g. has-class) once, the
+# first time selectors are needed, rather than on ``import parsel``.
+xpathfuncs.setup()
@@ -1,5 +1,16 @@
 import re
-from typing import Any, Iterable, Iterator, List, Match, Pattern, Union, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Union,
+    cast,
+)
 
 from w3lib.html import replace_entities as w3lib_replace_entities
 
@@ -56,6 +67,12 @@ def _is_listlike(x: Any) -> bool:
     return hasattr(x, "__iter__") and not isinstance(x, (str, bytes))
 
 
+@lru_cache(maxsize=512)
+def _compile_regex(regex: str) -> Pattern[str]:
+    # cheaper than the lookup in the re module's own cache
+    return re.compile(regex, re.UNICODE)
+
+
 def extract_regex(
     regex: Union[str, Pattern[str]], text: str, replace_entities: bool = True
 ) -> List[str]:
@@ -65,7 +82,7 @@ def extract_regex(
     * if the regex doesn't contain any group the entire regex matching is returned
     """
     if isinstance(regex, str):
-        regex = re.compile(regex, re.UNICODE)
+        regex = _compile_regex(regex)
 
     if "extract" in regex.groupindex:
         # named group
@@ -78,13 +95,45 @@ def extract_regex(
     else:
         # full regex or numbered groups
         strings = regex.findall(text)
+        if regex.groups > 1:
+            # findall() returns a tuple of groups for each match
+            strings = [s for groups in strings for s in groups]
 
-    strings = flatten(strings)
     if not replace_entities:
         return strings
     return [w3lib_replace_entities(s, keep=["lt", "amp"]) for s in strings]
 
 
+def extract_regex_first(
+    regex: Union[str, Pattern[str]], text: str, replace_entities: bool = True
+) -> Optional[str]:
+    """Return the first string that :func:`extract_regex` would return for
+    the same arguments, or ``None`` if there is none, stopping at the first
+    match of the regex.
+    """
+    if isinstance(regex, str):
+        regex = _compile_regex(regex)
+
+    match = regex.search(text)
+    if match is None:
+        return None
+    if "extract" in regex.groupindex:
+        # named group
+        extracted = match.group("extract")
+        if extracted is None:
+            return None
+    elif regex.groups:
+        # numbered groups, findall() reports unmatched groups as ""
+        extracted = match.group(1) or ""
+    else:
+        # full regex
+        extracted = match.group()
+
+    if not replace_entities:
+        return extracted
+    return w3lib_replace_entities(extracted, keep=["lt", "amp"])
+
+
 def shorten(text: str, width: int, suffix: str = "...") -> str:
     """Truncate the given text to fit in the given width."""
     if len(text) <= width:
@@ -1,5 +1,5 @@
 import re
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
 
 from lxml import etree
 from w3lib.html import HTML5_WHITESPACE
@@ -7,6 +7,10 @@ from w3lib.html import HTML5_WHITESPACE
 regex = f"[{HTML5_WHITESPACE}]+"
 replace_html5_whitespaces = re.compile(regex).sub
 
+# Called after every set_xpathfunc() change, e.g. by parsel.selector to drop
+# compiled XPath expressions that may still refer to the previous function.
+_on_xpathfunc_change: List[Callable[[], None]] = []
+
 
 def set_xpathfunc(fname: str, func: Optional[Callable]) -> None:  # type: ignore[type-arg]
     """Register a custom extension function to use in XPath expressions.
@@ -17,6 +21,11 @@ def set_xpathfunc(fname: str, func: Optional[Callable]) -> None:  # type: ignore
 
     If ``func`` is ``None``, the extension function will be removed.
 
+    Extension functions should be changed through this function only:
+    selectors reuse compiled XPath expressions, which keep using the
+    functions they were compiled with if ``etree.FunctionNamespace`` is
+    modified directly.
+
     See more `in lxml documentation`_.
 
     .. _`in lxml documentation`: https://lxml.de/extensions.html#xpath-extension-functions
@@ -27,6 +36,8 @@ def set_xpathfunc(fname: str, func: Optional[Callable]) -> None:  # type: ignore
         ns_fns[fname] = func
     else:
         del ns_fns[fname]
+    for callback in _on_xpathfunc_change:
+        callback()
 
 
 def setup() -> None:
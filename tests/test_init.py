@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+
+
+def _run(code: str) -> str:
+    # a fresh interpreter, so that no parsel submodule is imported yet
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return output.strip()
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_public_names(self) -> None:
+        output = _run(
+            "import sys, parsel\n"
+            "print('parsel.selector' in sys.modules)\n"
+            "print(parsel.Selector.__module__, parsel.css2xpath.__module__)\n"
+            "print(parsel.SelectorList is parsel.selector.SelectorList)\n"
+        )
+        self.assertEqual(
+            output.splitlines(),
+            ["False", "parsel.selector parsel.csstranslator", "True"],
+        )
+
+    def test_submodules(self) -> None:
+        for name in ("csstranslator", "selector", "utils", "xpathfuncs"):
+            with self.subTest(name=name):
+                output = _run(f"import parsel; print(parsel.{name}.__name__)")
+                self.assertEqual(output, f"parsel.{name}")
+
+    def test_unknown_attribute(self) -> None:
+        import parsel
+
+        with self.assertRaises(AttributeError):
+            getattr(parsel, "missing")
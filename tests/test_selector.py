@@ -1,5 +1,6 @@
 import pickle
 import re
+import threading
 import typing
 import unittest
 import warnings
@@ -7,7 +8,7 @@ import weakref
 from typing import Any, Mapping, Optional, cast
 
 from lxml import etree
-from lxml.html import HtmlElement
+from lxml.html import HtmlElement, HTMLParser
 from packaging.version import Version
 
 from parsel import Selector, SelectorList
@@ -16,6 +17,8 @@ from parsel.selector import (
     LXML_SUPPORTS_HUGE_TREE,
     CannotRemoveElementWithoutParent,
     CannotRemoveElementWithoutRoot,
+    _compile_xpath,
+    _get_parser,
 )
 
 
@@ -172,6 +175,20 @@ class SelectorTestCase(unittest.TestCase):
             ["a"],
         )
 
+    def test_xpath_extensions(self) -> None:
+        def hello(context: Any) -> str:
+            return "hi"
+
+        sel = self.sscls(text="<p>a</p>")
+        ns = {"f": "urn:x"}
+        extensions = {("urn:x", "hello"): hello}
+        for _ in range(2):
+            self.assertEqual(
+                sel.xpath("f:hello()", namespaces=ns, extensions=extensions).getall(),
+                ["hi"],
+            )
+        self.assertRaises(ValueError, sel.xpath, "f:hello()", namespaces=ns)
+
     def test_accessing_attributes(self) -> None:
         body = """
 <html lang="en" version="1.0">
@@ -404,6 +421,8 @@ class SelectorTestCase(unittest.TestCase):
         trueish = hs.xpath("//a/@href")[1]
         self.assertEqual(trueish.extract(), "nonempty")
         self.assertTrue(trueish)
+        self.assertTrue(hs.xpath("//a")[0])
+        self.assertTrue(self.sscls(text="<a><!----></a>").xpath("//comment()")[0])
 
     def test_slicing(self) -> None:
         text = "<div><p>1</p><p>2</p><p>3</p></div>"
@@ -766,6 +785,76 @@ class SelectorTestCase(unittest.TestCase):
         self.assertEqual(xs.extract(), "<root>lala</root>")
         self.assertEqual(xs.xpath(".").extract(), ["<root>lala</root>"])
 
+    def test_compiled_xpath_reuse(self) -> None:
+        sel = self.sscls(text="<html><body><p>a</p><p>b</p></body></html>")
+        query = "//p[$n]/text()"
+        self.assertEqual(sel.xpath(query, n=1).getall(), ["a"])
+        hits = _compile_xpath.cache_info().hits
+        self.assertEqual(sel.xpath(query, n=2).getall(), ["b"])
+        self.assertEqual(_compile_xpath.cache_info().hits, hits + 1)
+        self.assertEqual(sel.xpath("//p").xpath("./text()").getall(), ["a", "b"])
+
+    def test_child_selectors(self) -> None:
+        sel = self.sscls(text="<html><body><p>a</p></body></html>")
+        sel.register_namespace("x", "http://example.com/x")
+        (child,) = sel.xpath("//p")
+        self.assertIsInstance(child, self.sscls)
+        self.assertEqual(child.type, "html")
+        self.assertEqual(child._expr, "//p")
+        self.assertEqual(child.get(), "<p>a</p>")
+        self.assertEqual(child.namespaces, sel.namespaces)
+        child.register_namespace("y", "http://example.com/y")
+        self.assertNotIn("y", sel.namespaces)
+        sel.register_namespace("z", "http://example.com/z")
+        self.assertNotIn("z", child.namespaces)
+
+    def test_child_selectors_namespaces_are_independent(self) -> None:
+        sel = self.sscls(text="<html><body><p>a</p><p>b</p></body></html>")
+        first, second = sel.xpath("//p")
+        first.namespaces["x"] = "http://example.com/x"
+        self.assertNotIn("x", second.namespaces)
+        self.assertNotIn("x", sel.namespaces)
+        self.assertEqual(first.xpath("count(//x:p)").get(), "0.0")
+        json_sel = self.sscls(text='{"a": {"b": 1}}')
+        (child,) = json_sel.jmespath("a")
+        child.namespaces["x"] = "http://example.com/x"
+        self.assertNotIn("x", self.sscls._default_namespaces)
+        json_sel.register_namespace("y", "http://example.com/y")
+        self.assertNotIn("y", self.sscls._default_namespaces)
+        self.assertNotIn("y", self.sscls(text="<html/>").namespaces)
+
+    def test_namespaces_reference_kept_across_xpath(self) -> None:
+        sel = self.sscls(
+            text='<root xmlns:z="http://example.com/z"><z:p>a</z:p></root>',
+            type="xml",
+        )
+        ns = sel.namespaces
+        (child,) = sel.xpath("/root")
+        self.assertIs(sel.namespaces, ns)
+        ns["z"] = "http://example.com/z"
+        self.assertEqual(sel.xpath("//z:p/text()").getall(), ["a"])
+        self.assertNotIn("z", child.namespaces)
+
+    def test_text_results_type(self) -> None:
+        sel = self.sscls(
+            text="<p>Item</p><p>true story</p><p> 12</p><p>null</p><p>[1]</p>"
+        )
+        self.assertEqual(
+            [x.type for x in sel.xpath("//p/text()")],
+            ["html", "html", "json", "json", "json"],
+        )
+
+    def test_child_selectors_subclass_init(self) -> None:
+        class InitSelector(Selector):
+            __slots__ = ["extra"]
+
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                self.extra = "set"
+
+        sel = InitSelector(text="<html><body><p>a</p></body></html>")
+        self.assertEqual([x.extra for x in sel.xpath("//p")], ["set"])
+
     def test_invalid_xpath(self) -> None:
         "Test invalid xpath raises ValueError with the invalid xpath"
         x = self.sscls(text="<html></html>")
@@ -792,6 +881,10 @@ class SelectorTestCase(unittest.TestCase):
     def test_empty_bodies_shouldnt_raise_errors(self) -> None:
         self.sscls(text="").xpath("//text()").extract()
 
+    def test_empty_xml_bodies_shouldnt_raise_errors(self) -> None:
+        sel = self.sscls(text="", type="xml")
+        self.assertEqual(sel.xpath("/*").getall(), ["<html/>"])
+
     def test_bodies_with_comments_only(self) -> None:
         sel = self.sscls(text="<!-- hello world -->", base_url="http://example.com")
         self.assertEqual("http://example.com", sel.root.base)
@@ -982,6 +1075,25 @@ class SelectorTestCase(unittest.TestCase):
         content: str = sel.css("div")[0].extra_method()
         self.assertEqual("extra<div>foo</div>", content)
 
+    def test_parsers_are_reused_per_thread(self) -> None:
+        body = "<html><body><p>{}</p></body></html>"
+        results = []
+
+        def parse(text: str) -> None:
+            sel = self.sscls(text=body.format(text))
+            results.append(sel.css("p::text").get())
+
+        threads = [threading.Thread(target=parse, args=(str(i),)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), ["0", "1", "2", "3"])
+
+        parser = _get_parser(HTMLParser, "utf-8", huge_tree=True)
+        self.assertIs(_get_parser(HTMLParser, "utf-8", huge_tree=True), parser)
+        self.assertIsNot(_get_parser(HTMLParser, "utf-8", huge_tree=False), parser)
+
     def test_replacement_null_char_from_body(self) -> None:
         text = "<html>\x00<body><p>Grainy</p></body></html>"
         self.assertEqual(
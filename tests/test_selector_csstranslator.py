@@ -7,12 +7,20 @@ from typing import Any, Callable, List, Protocol, Tuple, Type, Union
 
 import cssselect
 import pytest
-from cssselect.parser import SelectorSyntaxError
+from cssselect import GenericTranslator as OriginalGenericTranslator
+from cssselect.parser import FunctionalPseudoElement, SelectorSyntaxError
 from cssselect.xpath import ExpressionError
+from cssselect.xpath import XPathExpr as OriginalXPathExpr
 from packaging.version import Version
 
 from parsel import Selector
-from parsel.csstranslator import GenericTranslator, HTMLTranslator, TranslatorProtocol
+from parsel.csstranslator import (
+    GenericTranslator,
+    HTMLTranslator,
+    TranslatorMixin,
+    TranslatorProtocol,
+    XPathExpr,
+)
 
 HTMLBODY = """
 <html>
@@ -159,6 +167,61 @@ class GenericTranslatorTest(TranslatorTestMixin, unittest.TestCase):
     tr_cls = GenericTranslator
 
 
+class CustomPseudoElementTest(unittest.TestCase):
+    def test_subclass_pseudo_elements(self) -> None:
+        class MyTranslator(HTMLTranslator):
+            def xpath_own_text_simple_pseudo_element(
+                self, xpath: OriginalXPathExpr
+            ) -> XPathExpr:
+                return XPathExpr.from_xpath(xpath, textnode=True)
+
+            def xpath_data_functional_pseudo_element(
+                self, xpath: OriginalXPathExpr, function: FunctionalPseudoElement
+            ) -> XPathExpr:
+                return XPathExpr.from_xpath(
+                    xpath, attribute=f"data-{function.arguments[0].value}"
+                )
+
+        c2x = MyTranslator().css_to_xpath
+        self.assertEqual(c2x("p::own-text"), "descendant-or-self::p/text()")
+        self.assertEqual(c2x("a::data(id)"), "descendant-or-self::a/@data-id")
+        self.assertEqual(c2x("a::attr(href)"), "descendant-or-self::a/@href")
+        self.assertRaises(ExpressionError, HTMLTranslator().css_to_xpath, "p::data(id)")
+
+    def test_subclass_without_super_init(self) -> None:
+        class MyTranslator(TranslatorMixin, OriginalGenericTranslator):
+            def __init__(self) -> None:
+                pass
+
+        translator = MyTranslator()
+        for _ in range(2):
+            self.assertEqual(
+                translator.css_to_xpath("p::text"), "descendant-or-self::p/text()"
+            )
+
+    def test_pseudo_elements_added_later(self) -> None:
+        class MyTranslator(HTMLTranslator):
+            pass
+
+        def own_text(xpath: OriginalXPathExpr) -> XPathExpr:
+            return XPathExpr.from_xpath(xpath, textnode=True)
+
+        setattr(
+            MyTranslator, "xpath_own_text_simple_pseudo_element", staticmethod(own_text)
+        )
+        translator = MyTranslator()
+        setattr(
+            translator,
+            "xpath_data_functional_pseudo_element",
+            lambda xpath, function: XPathExpr.from_xpath(
+                xpath, attribute=f"data-{function.arguments[0].value}"
+            ),
+        )
+        c2x = translator.css_to_xpath
+        self.assertEqual(c2x("p::own-text"), "descendant-or-self::p/text()")
+        self.assertEqual(c2x("a::data(id)"), "descendant-or-self::a/@data-id")
+
+
 class UtilCss2XPathTest(unittest.TestCase):
     def test_css2xpath(self) -> None:
         from parsel import css2xpath
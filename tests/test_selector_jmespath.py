@@ -3,7 +3,7 @@
 import unittest
 
 from parsel import Selector
-from parsel.selector import _NOT_SET
+from parsel.selector import _NOT_SET, _compile_jmespath
 
 
 class JMESPathTestCase(unittest.TestCase):
@@ -168,3 +168,25 @@ class JMESPathTestCase(unittest.TestCase):
             self.assertEqual(selector.type, "json")
             self.assertEqual(selector._text, None)  # pylint: disable=protected-access
             self.assertEqual(selector.root, root)
+
+    def test_repeated_queries_on_embedded_json(self) -> None:
+        sel = Selector(text='<div><content>{"user": "a"}</content></div>')
+        (content,) = sel.xpath("//div/content")
+        self.assertEqual(content.jmespath("user").getall(), ["a"])
+        self.assertEqual(content.jmespath("user").getall(), ["a"])
+        content.root.text = '{"user": "b"}'
+        self.assertEqual(content.jmespath("user").getall(), ["b"])
+
+    def test_modified_child_does_not_change_parent(self) -> None:
+        sel = Selector(text='<div><content>{"a": {"b": 1}}</content></div>')
+        (content,) = sel.xpath("//div/content")
+        (child,) = content.jmespath("a")
+        child.root["b"] = 2
+        self.assertEqual(content.jmespath("a.b").getall(), [1])
+
+    def test_compiled_jmespath_reuse(self) -> None:
+        sel = Selector(text='{"user": [{"name": "a"}, {"name": "b"}]}')
+        self.assertEqual(sel.jmespath("user[*].name").getall(), ["a", "b"])
+        hits = _compile_jmespath.cache_info().hits
+        self.assertEqual(sel.jmespath("user[*].name").getall(), ["a", "b"])
+        self.assertEqual(_compile_jmespath.cache_info().hits, hits + 1)
@@ -1,8 +1,8 @@
-from typing import List, Pattern, Type, Union
+from typing import List, Optional, Pattern, Type, Union
 
 from pytest import mark, raises
 
-from parsel.utils import extract_regex, shorten
+from parsel.utils import extract_regex, extract_regex_first, shorten
 
 
 @mark.parametrize(
@@ -75,3 +75,28 @@ def test_extract_regex(
     expected: List[str],
 ) -> None:
     assert extract_regex(regex, text, replace_entities) == expected
+
+
+@mark.parametrize(
+    "regex, text, replace_entities, expected",
+    (
+        [r"(?P<extract>\d+)", "October 25, 2019", True, "25"],
+        [r"(?P<extract>\d+)?October", "October 25, 2019", True, None],
+        [r"(\d+)", "October 25, 2019", True, "25"],
+        [r"(\d+)?(\w+)", "October 25, 2019", True, ""],
+        [r"\d+", "October 25, 2019", True, "25"],
+        [r"\d+", "October", True, None],
+        [r"&\w+;", "&quot;sometext&quot;", True, '"'],
+        [r"&\w+;", "&quot;sometext&quot;", False, "&quot;"],
+    ),
+)
+def test_extract_regex_first(
+    regex: Union[str, Pattern[str]],
+    text: str,
+    replace_entities: bool,
+    expected: Optional[str],
+) -> None:
+    assert extract_regex_first(regex, text, replace_entities) == expected
+    assert extract_regex(regex, text, replace_entities)[:1] == (
+        [] if expected is None else [expected]
+    )